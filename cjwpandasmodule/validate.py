@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import Any, Dict, List, NamedTuple, Optional, Protocol, Tuple
 
 import numpy as np
 import pandas as pd
@@ -30,6 +30,31 @@ class DefaultSettings(Settings):
     pass
 
 
+class CoerceReport(NamedTuple):
+    """What `coerce_dataframe()` changed.
+
+    * `reset_index`: True if the index was replaced with a RangeIndex.
+    * `unused_categories`: removed categories, keyed by column name. (These
+      may be non-str: e.g., unused int categories recast to empty dtype=object.)
+    * `object_categories`: columns whose empty categories became dtype=object.
+    * `infinities`: number of infinities replaced by NaN, keyed by column name.
+    """
+
+    reset_index: bool
+    unused_categories: Dict[str, List[Any]]
+    object_categories: List[str]
+    infinities: Dict[str, int]
+
+    @property
+    def changed(self) -> bool:
+        return bool(
+            self.reset_index
+            or self.unused_categories
+            or self.object_categories
+            or self.infinities
+        )
+
+
 def validate_series(series: pd.Series) -> None:
     """Ensure `series` is Workbench "Pandas-valid", or raise ValueError.
 
@@ -63,20 +88,7 @@ def validate_series(series: pd.Series) -> None:
             )
     elif hasattr(series, "cat"):
         categories = series.cat.categories
-        if categories.dtype != object:
-            raise ValueError(
-                (
-                    "invalid categorical dtype %s in column %r "
-                    "(categories must have dtype=object)"
-                )
-                % (categories.dtype, series.name)
-            )
-        nonstr = categories.map(type) != str
-        if nonstr.any():
-            raise ValueError(
-                "invalid value %r in column %r (categories must all be str)"
-                % (categories[np.flatnonzero(nonstr)[0]], series.name)
-            )
+        _validate_categories(categories, series.name)
 
         # Detect unused categories: they waste space, and since the module
         # author need only .remove_unused_categories() there isn't much reason
@@ -105,6 +117,23 @@ def validate_series(series: pd.Series) -> None:
         raise ValueError("unsupported dtype %r in column %r" % (dtype, series.name))
 
 
+def _validate_categories(categories: pd.Index, name: str) -> None:
+    if categories.dtype != object:
+        raise ValueError(
+            (
+                "invalid categorical dtype %s in column %r "
+                "(categories must have dtype=object)"
+            )
+            % (categories.dtype, name)
+        )
+    nonstr = categories.map(type) != str
+    if nonstr.any():
+        raise ValueError(
+            "invalid value %r in column %r (categories must all be str)"
+            % (categories[np.flatnonzero(nonstr)[0]], name)
+        )
+
+
 def validate_dataframe(
     df: pd.DataFrame, settings: Settings = DefaultSettings()
 ) -> None:
@@ -121,6 +150,19 @@ def validate_dataframe(
     The ValueError is not i18n-ized. These errors are targeted at people who
     programmed buggy Python code. Python is English-only.
     """
+    _validate_column_names(df, settings)
+
+    if not df.index.equals(pd.RangeIndex(0, len(df))):
+        raise ValueError(
+            "must use the default RangeIndex — "
+            "try table.reset_index(drop=True, inplace=True)"
+        )
+
+    for column in df.columns:
+        validate_series(df[column])
+
+
+def _validate_column_names(df: pd.DataFrame, settings: Settings) -> None:
     if df.columns.dtype != object or not (df.columns.map(type) == str).all():
         raise ValueError("column names must all be str")
 
@@ -152,11 +194,122 @@ def validate_dataframe(
                 'column name "%s" must not appear more than once' % colname
             )
 
-    if not df.index.equals(pd.RangeIndex(0, len(df))):
-        raise ValueError(
-            "must use the default RangeIndex — "
-            "try table.reset_index(drop=True, inplace=True)"
-        )
 
+def _coerce_infinities(series: pd.Series) -> Tuple[Optional[np.ndarray], int]:
+    """Replace +/-inf with NaN in float `series`; return (values, count).
+
+    `values` is None if there is no infinity. Otherwise it is a new array: we
+    never write to the column's buffer, because other frames or arrays (a
+    frame we were sliced from, the ndarray we were built from, a shallow
+    copy, Arrow) may share it.
+    """
+    values = series.values
+    mask = np.isinf(values)
+    n = np.count_nonzero(mask)
+    if not n:
+        return None, 0
+    values = values.copy()
+    values[mask] = np.nan
+    return values, n
+
+
+def _coerce_categories(
+    series: pd.Series,
+) -> Tuple[Optional[pd.Categorical], List[Any], bool]:
+    """Remove unused categories from categorical `series`, or raise ValueError.
+
+    Also change empty categories to dtype=object: Pandas picks float64 for
+    `pd.Series([np.nan]).astype("category")`.
+
+    Return (values, unused_categories, is_object_recast). `values` is None if
+    `series` is already valid. Raise before building anything if the remaining
+    categories are invalid.
+    """
+    values = series.values  # pd.Categorical
+    categories = values.categories
+    codes = values.codes
+    used = np.bincount(codes[codes >= 0], minlength=len(categories)) > 0
+
+    new_categories = categories[used]
+    is_object_recast = len(new_categories) == 0 and new_categories.dtype != object
+    if is_object_recast:
+        new_categories = pd.Index([], dtype=object)
+    _validate_categories(new_categories, series.name)
+
+    if used.all() and not is_object_recast:
+        return None, [], False
+
+    # remap[old_code] = new_code. The extra -1 at the end maps null (-1) to
+    # null, because numpy reads index -1 as "last".
+    remap = np.full(len(categories) + 1, -1, dtype=codes.dtype)
+    remap[np.flatnonzero(used)] = np.arange(len(new_categories), dtype=codes.dtype)
+    return (
+        pd.Categorical.from_codes(
+            remap[codes], categories=new_categories, ordered=values.ordered
+        ),
+        list(categories[~used]),
+        is_object_recast,
+    )
+
+
+def coerce_dataframe(
+    df: pd.DataFrame, settings: Settings = DefaultSettings()
+) -> CoerceReport:
+    """Fix cheap "Pandas-valid" violations in `df`, in place; or raise ValueError.
+
+    Fixes:
+
+    * A non-default index becomes a RangeIndex starting at 0 (data is not
+      copied).
+    * Unused categories are removed (codes are remapped; values are not
+      touched).
+    * Empty categories with non-object dtype become dtype=object.
+    * Infinity in a float column becomes NaN. This column gets a new buffer:
+      arrays that referenced the old column still hold infinity.
+
+    Anything else `validate_dataframe()` rejects raises the same ValueError,
+    and then `df` is left unmodified.
+    """
+    _validate_column_names(df, settings)
+
+    # First pass: validate, and compute replacement columns. Don't touch `df`.
+    new_columns = {}
+    unused_categories = {}
+    object_categories = []
+    infinities = {}
     for column in df.columns:
-        validate_series(df[column])
+        series = df[column]
+        dtype = series.dtype
+        if dtype in SupportedNumberDtypes:
+            if dtype.kind == "f":  # integers can't hold infinity
+                values, n = _coerce_infinities(series)
+                if n:
+                    new_columns[column] = values
+                    infinities[column] = n
+        elif hasattr(series, "cat"):
+            values, unused, is_object_recast = _coerce_categories(series)
+            if values is not None:
+                new_columns[column] = values
+            if unused:
+                unused_categories[column] = unused
+            if is_object_recast:
+                object_categories.append(column)
+        else:
+            validate_series(series)
+
+    # Second pass: modify `df`.
+    reset_index = not df.index.equals(pd.RangeIndex(0, len(df)))
+    if reset_index:
+        df.index = pd.RangeIndex(0, len(df))
+    # `df` may be a slice of another DataFrame. We mean to modify `df`, not the
+    # other DataFrame; don't warn module authors with SettingWithCopyWarning.
+    with pd.option_context("mode.chained_assignment", None):
+        for column, values in new_columns.items():
+            df[column] = values
+
+    return CoerceReport(
+        reset_index=reset_index,
+        unused_categories=unused_categories,
+        object_categories=object_categories,
+        infinities=infinities,
+    )
@@ -1,10 +1,13 @@
+import warnings
 from datetime import date
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 import pytest
 
-from cjwpandasmodule.validate import validate_dataframe
+from cjwpandasmodule.convert import arrow_table_to_pandas_dataframe
+from cjwpandasmodule.validate import coerce_dataframe, validate_dataframe
 
 
 def test_index():
@@ -188,3 +191,129 @@ def test_colnames_too_long():
 
     with pytest.raises(ValueError, match="must contain 10 bytes or fewer"):
         validate_dataframe(pd.DataFrame({"01234567890": [1]}), settings=MySettings())
+
+
+def test_coerce_valid_no_change():
+    dataframe = pd.DataFrame(
+        {
+            "A": [1, 2],
+            "B": ["x", None],
+            "C": [1.0, np.nan],
+            "D": pd.Categorical(["x", None]),
+        }
+    )
+    report = coerce_dataframe(dataframe)
+    assert not report.changed
+    validate_dataframe(dataframe)
+
+
+def test_coerce_index():
+    dataframe = pd.DataFrame({"A": [1, 2, 3]})[1:]
+    report = coerce_dataframe(dataframe)
+    assert report.reset_index
+    assert dataframe.index.equals(pd.RangeIndex(0, 2))
+    assert dataframe["A"].tolist() == [2, 3]
+
+
+def test_coerce_unused_categories():
+    dataframe = pd.DataFrame(
+        {"A": ["c", None, "a", "c"]}, dtype=pd.CategoricalDtype(["a", "b", "c", "d"])
+    )
+    report = coerce_dataframe(dataframe)
+    assert report.unused_categories == {"A": ["b", "d"]}
+    assert list(dataframe["A"].cat.categories) == ["a", "c"]
+    assert dataframe["A"].tolist()[0] == "c"
+    assert dataframe["A"].isnull().tolist() == [False, True, False, False]
+    assert dataframe["A"].tolist()[2:] == ["a", "c"]
+    validate_dataframe(dataframe)
+
+
+def test_coerce_empty_categories_with_wrong_dtype():
+    dataframe = pd.DataFrame({"A": [np.nan]}, dtype=float).astype("category")
+    report = coerce_dataframe(dataframe)
+    assert report.object_categories == ["A"]
+    validate_dataframe(dataframe)
+
+
+def test_coerce_empty_categories_reports_unused_non_str():
+    dataframe = pd.DataFrame({"A": pd.Categorical([None], categories=[1, 2])})
+    report = coerce_dataframe(dataframe)
+    assert report.unused_categories == {"A": [1, 2]}
+    assert report.object_categories == ["A"]
+    validate_dataframe(dataframe)
+
+
+def test_coerce_non_str_categories():
+    dataframe = pd.DataFrame({"A": ["a", 1]}, dtype="category")
+    with pytest.raises(ValueError, match="must all be str"):
+        coerce_dataframe(dataframe)
+
+
+def test_coerce_invalid_categories_does_not_modify():
+    dataframe = pd.DataFrame({"A": pd.Categorical([1], categories=[1, 2])})
+    with pytest.raises(ValueError, match="must have dtype=object"):
+        coerce_dataframe(dataframe)
+    assert list(dataframe["A"].cat.categories) == [1, 2]
+
+
+def test_coerce_categories_of_slice_does_not_warn():
+    dataframe = pd.DataFrame({"A": pd.Categorical(["a", "b", "c"])})[2:]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        report = coerce_dataframe(dataframe)
+    assert report.unused_categories == {"A": ["a", "b"]}
+    assert dataframe["A"].tolist() == ["c"]
+    validate_dataframe(dataframe)
+
+
+def test_coerce_infinity():
+    # Make 'A': [1, -inf, +inf, nan]
+    num = pd.Series([1, -2, 3, np.nan])
+    denom = pd.Series([1, 0, 0, 1])
+    dataframe = pd.DataFrame({"A": num / denom})
+    report = coerce_dataframe(dataframe)
+    assert report.infinities == {"A": 2}
+    assert dataframe["A"].isnull().tolist() == [False, True, True, True]
+    validate_dataframe(dataframe)
+
+
+def test_coerce_infinity_does_not_modify_sliced_dataframe():
+    orig = pd.DataFrame({"A": [1.0, np.inf, -np.inf, 2.0], "B": ["a", "b", "c", "d"]})
+    dataframe = orig[1:]
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        report = coerce_dataframe(dataframe)
+    assert report.infinities == {"A": 2}
+    assert dataframe["A"].isnull().tolist() == [True, True, False]
+    assert orig["A"].tolist() == [1.0, np.inf, -np.inf, 2.0]
+
+
+def test_coerce_infinity_does_not_modify_ndarray():
+    arr = np.array([[1.0, np.inf], [-np.inf, 2.0]])
+    dataframe = pd.DataFrame(arr, columns=["A", "B"])
+    report = coerce_dataframe(dataframe)
+    assert report.infinities == {"A": 1, "B": 1}
+    assert arr.tolist() == [[1.0, np.inf], [-np.inf, 2.0]]
+    validate_dataframe(dataframe)
+
+
+def test_coerce_infinity_from_arrow():
+    table = pa.table({"A": pa.array([1.0, np.inf, -np.inf, None])})
+    dataframe = arrow_table_to_pandas_dataframe(table)
+    report = coerce_dataframe(dataframe)
+    assert report.infinities == {"A": 2}
+    assert dataframe["A"].isnull().tolist() == [False, True, True, True]
+    assert table["A"].to_pylist() == [1.0, np.inf, -np.inf, None]
+    validate_dataframe(dataframe)
+
+
+def test_coerce_non_str_objects():
+    with pytest.raises(ValueError, match="must all be str"):
+        coerce_dataframe(pd.DataFrame({"A": ["a", 1]}))
+
+
+def test_coerce_invalid_colname_does_not_modify():
+    dataframe = pd.DataFrame({"": [1, 2, 3]})[1:]
+    with pytest.raises(ValueError, match="must not be empty"):
+        coerce_dataframe(dataframe)
+    assert dataframe.index.tolist() == [1, 2]